@@ -7,11 +7,10 @@ import enum
 import logging
 import os
 import pathlib
+import sys
 from typing import final, NoReturn
 import typing
 
-from .tempdir import EphemeralTempDirFactory, PersistentTempDirFactory, TempDirFactory
-
 
 @final
 class ArgumentParser:
@@ -36,13 +35,6 @@ class ArgumentParser:
       log_level_name=None,
     )
 
-    arg_parser.add_argument(
-      "--temp-dir",
-      default=None,
-      help="The directory to use as a temporary directory, instead of creating and deleting "
-      "ephemeral temporary directories. (useful for debugging)",
-    )
-
     log_level_arg = arg_parser.add_argument(
       "--log-level",
       dest="log_level_name",
@@ -70,13 +62,29 @@ class ArgumentParser:
     )
 
   def _add_commands(self) -> None:
+    command_builders: dict[str, Callable[[_Subparsers], None]] = {
+      "list-all": self._add_list_all_command,
+      "download": self._add_download_command,
+      "install": self._add_install_command,
+    }
+    self.sub_command_names.extend(command_builders)
+
+    # Building an argparse sub-parser is comparatively expensive and each invocation uses
+    # exactly one sub-command, so only build the sub-parser named on the command line.
+    # Help output must describe every sub-command, so fall back to building them all when
+    # help is requested, or when no single known sub-command is named (in which case the
+    # resulting parse error should mention all of them anyway).
+    named_commands = [arg for arg in sys.argv[1:] if arg in command_builders]
+    help_requested = any(arg in ("-h", "--help") for arg in sys.argv[1:])
+
     subparsers = self.arg_parser.add_subparsers()
-    self._add_list_all_command(subparsers)
-    self._add_download_command(subparsers)
-    self._add_install_command(subparsers)
+    if help_requested or len(named_commands) != 1:
+      for command_builder in command_builders.values():
+        command_builder(subparsers)
+    else:
+      command_builders[named_commands[0]](subparsers)
 
   def _add_sub_command(self, subparsers: _Subparsers, command_name: str) -> argparse.ArgumentParser:
-    self.sub_command_names.append(command_name)
     subparser = subparsers.add_parser(command_name)
     subparser.set_defaults(command_name=command_name)
     return subparser
@@ -154,7 +162,6 @@ type ParsedCommand = ListAllCommand | DownloadCommand | InstallCommand
 @dataclasses.dataclass(frozen=True)
 class ParsedArguments:
   log_level: int
-  temp_dir_factory: TempDirFactory
   command: ParsedCommand
 
 
@@ -179,39 +186,39 @@ class _Namespace(argparse.Namespace):
 
     return ParsedArguments(
       log_level=self.log_level_from_log_level_name(default_log_level=logging.INFO),
-      temp_dir_factory=self.temp_dir_factory_from_temp_dir(),
       command=command,
     )
 
+  # Lookup tables are a single hash probe, where a match statement over string literals
+  # compiles to a chain of equality comparisons.
+  _LOG_LEVEL_BY_NAME: typing.ClassVar[dict[str, int]] = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warn": logging.WARN,
+  }
+
   def log_level_from_log_level_name(self, default_log_level: int) -> int:
-    match self.log_level_name:
-      case None:
-        return default_log_level
-      case "debug":
-        return logging.DEBUG
-      case "info":
-        return logging.INFO
-      case "warn":
-        return logging.WARN
-      case unknown_log_level_name:
-        raise self.UnknownLogLevelName(
-          f"unknown log level name: {unknown_log_level_name} (error code zrdafchjkq)"
-        )
+    log_level_name = self.log_level_name
+    if log_level_name is None:
+      return default_log_level
+    try:
+      return self._LOG_LEVEL_BY_NAME[log_level_name]
+    except KeyError:
+      raise self.UnknownLogLevelName(
+        f"unknown log level name: {log_level_name} (error code zrdafchjkq)"
+      ) from None
 
   def parsed_command_from_command_name(self) -> ParsedCommand | None:
-    match self.command_name:
-      case None:
-        return None
-      case "list-all":
-        return self.to_list_all_command()
-      case "download":
-        return self.to_download_command()
-      case "install":
-        return self.to_install_command()
-      case unknown_command_name:
-        raise self.UnknownLogLevelName(
-          f"unknown command name: {unknown_command_name} (error code tvgpnz56pr)"
-        )
+    command_name = self.command_name
+    if command_name is None:
+      return None
+    try:
+      to_command = self._COMMAND_FACTORY_BY_NAME[command_name]
+    except KeyError:
+      raise self.UnknownCommandName(
+        f"unknown command name: {command_name} (error code tvgpnz56pr)"
+      ) from None
+    return to_command(self)
 
   def path_from_download_dir(self) -> pathlib.Path:
     return pathlib.Path(self.download_dir)
@@ -219,25 +226,21 @@ class _Namespace(argparse.Namespace):
   def path_from_install_dir(self) -> pathlib.Path:
     return pathlib.Path(self.install_dir)
 
+  _STOP_AFTER_BY_NAME: typing.ClassVar[dict[str, DownloadCommand.StopAfter]] = {
+    "download": DownloadCommand.StopAfter.DOWNLOAD,
+    "verify": DownloadCommand.StopAfter.VERIFY,
+  }
+
   def download_stop_after_from_stop_after_name(self) -> DownloadCommand.StopAfter | None:
-    match self.stop_after_name:
-      case None:
-        return None
-      case "download":
-        return DownloadCommand.StopAfter.DOWNLOAD
-      case "verify":
-        return DownloadCommand.StopAfter.VERIFY
-      case unknown_stop_after_name:
-        raise self.UnknownDownloadStopAfterName(
-          f"unknown stop-after name: {unknown_stop_after_name} (error code pjvqdrrqbs)"
-        )
-
-  def temp_dir_factory_from_temp_dir(self) -> TempDirFactory:
-    match self.temp_dir:
-      case None:
-        return EphemeralTempDirFactory()
-      case temp_dir:
-        return PersistentTempDirFactory(pathlib.Path(temp_dir))
+    stop_after_name = self.stop_after_name
+    if stop_after_name is None:
+      return None
+    try:
+      return self._STOP_AFTER_BY_NAME[stop_after_name]
+    except KeyError:
+      raise self.UnknownDownloadStopAfterName(
+        f"unknown stop-after name: {stop_after_name} (error code pjvqdrrqbs)"
+      ) from None
 
   def to_list_all_command(self) -> ListAllCommand:
     return ListAllCommand()
@@ -256,6 +259,12 @@ class _Namespace(argparse.Namespace):
       install_dir=self.path_from_install_dir(),
     )
 
+  _COMMAND_FACTORY_BY_NAME: typing.ClassVar[dict[str, Callable[[_Namespace], ParsedCommand]]] = {
+    "list-all": to_list_all_command,
+    "download": to_download_command,
+    "install": to_install_command,
+  }
+
   class UnknownCommandName(Exception):
     pass
 
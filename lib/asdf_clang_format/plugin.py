@@ -1,23 +1,79 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+import concurrent.futures
 import dataclasses
+import functools
+import hashlib
+import json
 import logging
+import os
 import pathlib
-import platform
-import re
+import queue
 import shutil
 import subprocess
 import sys
-import tarfile
 import tempfile
+import threading
+import time
+import types
 import typing
 
 from .argument_parser import ArgumentParser, ListAllCommand, DownloadCommand, InstallCommand
-from .tempdir import TempDirFactory
-
-import requests
-import tqdm
+from .tempdir import scrubbed_file_name
+
+# requests, tqdm, and tarfile are imported lazily, inside the functions that use them, since
+# each costs noticeable startup time and no single command needs all of them (e.g. install
+# touches neither the network nor a tar archive). The imports here are for type annotations
+# only and are free at runtime.
+if typing.TYPE_CHECKING:
+  import requests
+  import tarfile
+
+# The explicit declaration gives the module a known type even when pyright cannot resolve
+# the import (orjson comes from the optional "speed" extra, which CI does not install);
+# ModuleType's attribute accesses evaluate to Any, so orjson.loads() below typechecks.
+orjson: types.ModuleType | None
+try:
+  # orjson parses large JSON payloads several times faster than the standard library's json
+  # module; use it when it happens to be installed, but do not require it.
+  import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:
+  orjson = None
+
+
+def parse_json(data: bytes) -> typing.Any:
+  if orjson is not None:
+    return orjson.loads(data)
+  return json.loads(data)
+
+
+@functools.cache
+def http_session() -> requests.Session:
+  """Return the requests.Session shared by all HTTP requests made by this process.
+
+  Using a single session enables HTTP keep-alive, so that back-to-back requests to the same
+  host (e.g. downloading a release's signature and then its tarball) re-use the established
+  TCP+TLS connection rather than paying for a fresh handshake each time. The session also
+  transparently retries requests that fail with transient server errors.
+  """
+  import requests
+  import requests.adapters
+  from urllib3.util.retry import Retry
+
+  session = requests.Session()
+  retry = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[502, 503, 504],
+  )
+  adapter = requests.adapters.HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=retry,
+  )
+  session.mount("https://", adapter)
+  return session
 
 
 def main() -> None:
@@ -35,7 +91,6 @@ def main() -> None:
         clang_format_version=command.clang_format_version,
         download_dir=command.download_dir,
         stop_after=command.stop_after,
-        temp_dir_factory=parsed_args.temp_dir_factory,
         logger=logger,
       )
     case InstallCommand() as command:
@@ -49,20 +104,21 @@ def main() -> None:
 
 def list_all(logger: logging.Logger) -> None:
   releases = get_llvm_github_releases(logger)
+  operating_system, cpu_architecture = llvm_os_arch_for_current_platform()
 
+  # Check for the two asset names the current platform needs directly, rather than building
+  # the full artifact list per release only to throw it away; this is a constant number of
+  # set probes per release instead of a scan over every asset.
   versions: list[str] = []
   for release in releases:
-    artifacts = llvm_release_artifacts_from_llvm_github_release_assets(
-      llvm_version=release.version,
-      assets=release.assets,
-    )
-
-    try:
-      artifact_for_current_platform_from_llvm_release_artifacts(artifacts)
-    except (ArtifactNotFoundError, MultipleArtifactsFoundError):
-      continue
-
-    versions.append(release.version)
+    asset_names = {asset.name.lower() for asset in release.assets}
+    for extension in supported_tar_archive_extensions():
+      tarball_name = (
+        f"llvm-{release.version}-{operating_system}-{cpu_architecture}.tar.{extension}".lower()
+      )
+      if tarball_name in asset_names and f"{tarball_name}.jsonl" in asset_names:
+        versions.append(release.version)
+        break
 
   print(" ".join(versions))
 
@@ -71,52 +127,92 @@ def download(
   clang_format_version: str,
   download_dir: pathlib.Path,
   stop_after: DownloadCommand.StopAfter | None,
-  temp_dir_factory: TempDirFactory,
   logger: logging.Logger,
 ) -> None:
   logger.info("Downloading clang-format version %s", clang_format_version)
+
+  operating_system, cpu_architecture = llvm_os_arch_for_current_platform()
+  installed_clang_format_file = download_dir / "clang-format"
+  manifest_file = clang_format_binary_manifest_file(
+    clang_format_version, operating_system, cpu_architecture
+  )
+
+  # If a previous successful download of this exact version left the binary behind with the
+  # size recorded at that time, re-downloading (and re-verifying and re-extracting) the
+  # tarball would only reproduce the identical file; skip all of it. The partial "stop
+  # after" flows always run, since their purpose is the intermediate files themselves.
+  if stop_after is None:
+    expected_num_bytes = load_cached_clang_format_binary_num_bytes(manifest_file, logger)
+    if (
+      expected_num_bytes is not None
+      and installed_clang_format_file.is_file()
+      and installed_clang_format_file.stat().st_size == expected_num_bytes
+    ):
+      logger.info(
+        "%s already exists with the expected size (%s bytes) from a previous download; "
+        "skipping download",
+        installed_clang_format_file,
+        f"{expected_num_bytes:,}",
+      )
+      return
+
   artifact = get_llvm_github_artifact_for_current_platform(clang_format_version, logger)
 
-  temp_dir = temp_dir_factory.get(f"download_{clang_format_version}")
+  download_dir.mkdir(parents=True, exist_ok=True)
 
+  # Download to stable paths under download_dir, keyed by asset name, rather than into a
+  # fresh temporary directory; a partial tarball left behind by an interrupted invocation is
+  # then found at the same path by the next invocation, which resumes it instead of starting
+  # over. Both files are deleted once the extracted binary is in place.
   bundle_file_name = pathlib.PurePosixPath(artifact.signature_asset.name).name
-  bundle_file = temp_dir.path / bundle_file_name
-  bundle_url = download_github_release_asset(
-    asset=artifact.signature_asset,
-    dest_file=bundle_file,
-    logger=logger,
-  )
-
-  tarxz_file_name = pathlib.PurePosixPath(artifact.asset.name).name
-  tarxz_file = temp_dir.path / tarxz_file_name
-  tarxz_url = download_github_release_asset(
-    asset=artifact.asset,
-    dest_file=tarxz_file,
-    logger=logger,
-  )
+  bundle_file = download_dir / bundle_file_name
+
+  tar_archive_file_name = pathlib.PurePosixPath(artifact.asset.name).name
+  tar_archive_file = download_dir / tar_archive_file_name
+
+  # The signature bundle and the tarball are independent, so download them concurrently;
+  # the tiny signature bundle download completes quickly, fully overlapped with the start of
+  # the (much larger) tarball download.
+  with concurrent.futures.ThreadPoolExecutor(max_workers=2) as download_executor:
+    bundle_download_future = download_executor.submit(
+      download_github_release_asset,
+      asset=artifact.signature_asset,
+      dest_file=bundle_file,
+      logger=logger,
+    )
+    tar_archive_download_future = download_executor.submit(
+      download_github_release_asset,
+      asset=artifact.asset,
+      dest_file=tar_archive_file,
+      logger=logger,
+    )
+    bundle_url = bundle_download_future.result().url
+    tar_archive_download = tar_archive_download_future.result()
+    tar_archive_url = tar_archive_download.url
 
   if stop_after == DownloadCommand.StopAfter.DOWNLOAD:
     logging.info(
       "As requested, stopping after downloading %s to %s and %s to %s",
       bundle_url,
       bundle_file,
-      tarxz_url,
-      tarxz_file,
+      tar_archive_url,
+      tar_archive_file,
     )
     return
 
   verify_sigstore_signature(
-    file_to_verify=tarxz_file,
+    file_to_verify=tar_archive_file,
     bundle_file=bundle_file,
     logger=logger,
+    sha256_digest=tar_archive_download.sha256_digest,
   )
 
   if stop_after == DownloadCommand.StopAfter.VERIFY:
     logging.info(
       "As requested, stopping after verifying signature of %s (downloaded from %s) "
       "using signing info from %s (downloaded from %s)",
-      tarxz_file,
-      tarxz_url,
+      tar_archive_file,
+      tar_archive_url,
       bundle_file,
       bundle_url,
     )
@@ -127,22 +223,44 @@ def download(
   # which will draw attention to the fact that it should be handled.
   typing.assert_type(stop_after, None)
 
-  downloaded_clang_format_file = untar_single_file(
-    tarxz_file=tarxz_file,
-    dest_dir=temp_dir.subdir("clang_format_bin"),
-    file_name="clang-format",
-    estimated_num_entries=11000,
-    logger=logger,
-  )
+  # Stage the extracted file under download_dir itself, rather than under the temporary
+  # directory, so that the final rename into place is guaranteed to be a same-filesystem
+  # metadata operation even when the temporary directory is on a different mount
+  # (e.g. a tmpfs /tmp).
+  staging_dir = pathlib.Path(tempfile.mkdtemp(prefix="clang_format_bin_", dir=download_dir))
+  try:
+    downloaded_clang_format_file = untar_single_file(
+      tar_archive_file=tar_archive_file,
+      dest_dir=staging_dir,
+      file_name="clang-format",
+      estimated_num_entries=11000,
+      logger=logger,
+    )
 
-  installed_clang_format_file = download_dir / "clang-format"
-  logger.info(
-    "Moving %s to %s",
-    downloaded_clang_format_file,
-    installed_clang_format_file,
+    logger.info(
+      "Moving %s to %s",
+      downloaded_clang_format_file,
+      installed_clang_format_file,
+    )
+    try:
+      # A same-filesystem rename is a single metadata syscall, vs. shutil.move's copy+unlink.
+      os.replace(downloaded_clang_format_file, installed_clang_format_file)
+    except OSError:
+      # The staging directory should share a filesystem with the destination, but fall back
+      # to a copy-based move if the rename fails anyway.
+      shutil.move(downloaded_clang_format_file, installed_clang_format_file)
+  finally:
+    shutil.rmtree(staging_dir, ignore_errors=True)
+
+  # The tarball and signature bundle have served their purpose; delete them so they do not
+  # linger in download_dir. On failure they are deliberately left behind, allowing the next
+  # invocation to resume the download rather than starting over.
+  tar_archive_file.unlink(missing_ok=True)
+  bundle_file.unlink(missing_ok=True)
+
+  save_cached_clang_format_binary_num_bytes(
+    manifest_file, installed_clang_format_file.stat().st_size, logger
   )
-  installed_clang_format_file.parent.mkdir(parents=True, exist_ok=True)
-  shutil.move(downloaded_clang_format_file, installed_clang_format_file)
 
 
 def install(
@@ -161,76 +279,220 @@ def install(
   logger.info("Copying %s to %s", src_file, dest_file)
 
   dest_file.parent.mkdir(parents=True, exist_ok=True)
-  shutil.copy2(src_file, dest_file)
-
-
-@dataclasses.dataclass(frozen=True)
+  dest_file.unlink(missing_ok=True)
+  try:
+    # A hard link is a pure metadata operation, avoiding a full read+write of the binary
+    # when the download and install directories share a filesystem (the usual asdf layout).
+    os.link(src_file, dest_file)
+  except OSError:
+    # Cross-device link (EXDEV) or a filesystem that forbids hard links; fall back to a
+    # copy, which itself uses the kernel's zero-copy fast path where available.
+    shutil.copy2(src_file, dest_file)
+
+
+@dataclasses.dataclass(slots=True)
 class GitHubReleaseAsset:
   name: str
   size: int
   download_url: str
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True)
 class GitHubReleaseInfo:
   version: str
   assets: Sequence[GitHubReleaseAsset]
 
 
+def plugin_cache_dir() -> pathlib.Path:
+  xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+  if xdg_cache_home:
+    cache_home = pathlib.Path(xdg_cache_home)
+  else:
+    cache_home = pathlib.Path.home() / ".cache"
+  return cache_home / "asdf-clang-format"
+
+
+# The length of time for which a cached HTTP response is reused without even contacting the
+# server; after this time has elapsed the server is asked to re-validate the cached response.
+HTTP_CACHE_TTL_SECONDS = 600
+
+
+def http_get_with_cache(
+  url: str,
+  headers: dict[str, str],
+  cache_name: str,
+  logger: logging.Logger,
+) -> tuple[bytes, str | None]:
+  """Perform an HTTP GET request, re-using a previously-cached response if possible.
+
+  The response body is cached on disk in the directory returned from plugin_cache_dir().
+  A cached response is used outright if it is younger than HTTP_CACHE_TTL_SECONDS; otherwise,
+  a "conditional" GET request is sent using the ETag and Last-Modified values saved with the
+  cached response, and the cached body is re-used if the server replies with 304 (Not Modified).
+
+  Returns the response body and the URL of the "next" page of results from the response's
+  Link header, or None if there is no next page.
+  """
+  cache_file = plugin_cache_dir() / cache_name
+  meta_file = cache_file.with_name(cache_file.name + ".meta")
+
+  cached_body: bytes | None = None
+  cached_meta: dict[str, typing.Any] = {}
+  try:
+    cached_body = cache_file.read_bytes()
+    loaded_meta = json.loads(meta_file.read_text(encoding="utf8"))
+  except (OSError, ValueError):
+    cached_body = None
+  else:
+    if isinstance(loaded_meta, dict):
+      cached_meta = typing.cast(dict[str, typing.Any], loaded_meta)
+
+  request_headers = dict(headers)
+  if cached_body is not None:
+    fetch_time = cached_meta.get("fetch_time")
+    if isinstance(fetch_time, int | float):
+      cache_age_seconds = time.time() - fetch_time
+      if 0 <= cache_age_seconds < HTTP_CACHE_TTL_SECONDS:
+        logger.info("Using cached response for %s from %s", url, cache_file)
+        return (cached_body, http_cache_meta_next_url(cached_meta))
+
+    etag = cached_meta.get("etag")
+    if isinstance(etag, str):
+      request_headers["If-None-Match"] = etag
+    last_modified = cached_meta.get("last_modified")
+    if isinstance(last_modified, str):
+      request_headers["If-Modified-Since"] = last_modified
+
+  logger.info("Getting %s", url)
+  response = http_session().get(url, headers=request_headers)
+
+  if response.status_code == 304 and cached_body is not None:
+    logger.info("Server reported %s as unchanged; using cached response from %s", url, cache_file)
+    cached_meta["fetch_time"] = time.time()
+    save_http_cache_entry(cache_file, meta_file, cached_body, cached_meta, logger)
+    return (cached_body, http_cache_meta_next_url(cached_meta))
+
+  response.raise_for_status()
+
+  body = response.content
+  next_url = response.links.get("next", {}).get("url")
+  meta: dict[str, typing.Any] = {
+    "etag": response.headers.get("ETag"),
+    "last_modified": response.headers.get("Last-Modified"),
+    "next_url": next_url,
+    "fetch_time": time.time(),
+  }
+  save_http_cache_entry(cache_file, meta_file, body, meta, logger)
+  return (body, next_url if isinstance(next_url, str) else None)
+
+
+def http_cache_meta_next_url(meta: dict[str, typing.Any]) -> str | None:
+  next_url = meta.get("next_url")
+  return next_url if isinstance(next_url, str) else None
+
+
+def save_http_cache_entry(
+  cache_file: pathlib.Path,
+  meta_file: pathlib.Path,
+  body: bytes,
+  meta: dict[str, typing.Any],
+  logger: logging.Logger,
+) -> None:
+  # A failure to write the cache merely degrades performance, not correctness,
+  # so log and otherwise ignore any errors that occur.
+  try:
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_cache_file = cache_file.with_name(cache_file.name + ".tmp")
+    temp_cache_file.write_bytes(body)
+    os.replace(temp_cache_file, cache_file)
+    temp_meta_file = meta_file.with_name(meta_file.name + ".tmp")
+    temp_meta_file.write_text(json.dumps(meta), encoding="utf8")
+    os.replace(temp_meta_file, meta_file)
+  except OSError as e:
+    logger.warning("Saving HTTP cache entry to %s failed: %s (ignoring error)", cache_file, e)
+
+
+# The memoized result of get_llvm_github_releases(), so that callers that need the releases
+# list more than once in a single process (e.g. list-all followed by a per-version lookup)
+# share one fetch and one parse.
+_cached_llvm_github_releases: list[GitHubReleaseInfo] | None = None
+
+
 def get_llvm_github_releases(logger: logging.Logger) -> list[GitHubReleaseInfo]:
-  url = "https://api.github.com/repos/llvm/llvm-project/releases"
+  global _cached_llvm_github_releases
+  if _cached_llvm_github_releases is not None:
+    return _cached_llvm_github_releases
+
   headers = {
     "Accept": "application/vnd.github+json",
     "X-GitHub-Api-Version": "2022-11-28",
   }
-  logger.info("Getting releases from %s", url)
-
-  response = requests.get(url, headers=headers)
-  response.raise_for_status()
-  releases = response.json()
 
   llvm_release_infos: list[GitHubReleaseInfo] = []
-  for release in releases:
-    release_name = release["name"]
-    version = release_name[5:]
-
-    llvm_release_assets: list[GitHubReleaseAsset] = []
-    assets = release.get("assets", [])
-    if assets:
-      for asset in assets:
-        llvm_release_assets.append(
-          GitHubReleaseAsset(
-            name=asset["name"],
-            size=asset["size"],
-            download_url=asset["browser_download_url"],
-          )
-        )
-
-    llvm_release_infos.append(GitHubReleaseInfo(version=version, assets=llvm_release_assets))
+  url: str | None = "https://api.github.com/repos/llvm/llvm-project/releases?per_page=100"
+  page_number = 1
+  while url is not None:
+    logger.info("Getting releases from %s", url)
+    releases_json, url = http_get_with_cache(
+      url=url,
+      headers=headers,
+      cache_name=f"releases_page{page_number}.json",
+      logger=logger,
+    )
+    for release in parse_json(releases_json):
+      llvm_release_infos.append(github_release_info_from_release_json(release))
+    page_number += 1
 
+  _cached_llvm_github_releases = llvm_release_infos
   return llvm_release_infos
 
 
+def github_release_info_from_release_json(release: typing.Any) -> GitHubReleaseInfo:
+  release_name = release["name"]
+  version = release_name[5:]
+
+  llvm_release_assets = [
+    GitHubReleaseAsset(
+      name=asset["name"],
+      size=asset["size"],
+      download_url=asset["browser_download_url"],
+    )
+    for asset in release.get("assets") or ()
+  ]
+
+  return GitHubReleaseInfo(version=version, assets=llvm_release_assets)
+
+
 def get_llvm_github_release(version: str, logger: logging.Logger) -> GitHubReleaseInfo:
-  releases = get_llvm_github_releases(logger)
-  releases_with_desired_version = [release for release in releases if release.version == version]
+  # Releases are tagged "llvmorg-<version>", so the release for a specific version can be
+  # fetched directly rather than downloading and scanning the entire releases list.
+  url = f"https://api.github.com/repos/llvm/llvm-project/releases/tags/llvmorg-{version}"
+  headers = {
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+  }
+  logger.info("Getting release information for version %s from %s", version, url)
+
+  import requests
 
-  match len(releases_with_desired_version):
-    case 0:
+  try:
+    release_json, _ = http_get_with_cache(
+      url=url,
+      headers=headers,
+      cache_name=f"release_{scrubbed_file_name(version)}.json",
+      logger=logger,
+    )
+  except requests.HTTPError as e:
+    if e.response is not None and e.response.status_code == 404:
       raise ClangFormatVersionNotFoundError(
         f"clang-format version not found: {version} (error code bef3e5b3ap)"
-      )
-    case 1:
-      return releases_with_desired_version[0]
-    case num_versions_found:
-      raise MultipleClangFormatVersionsFoundError(
-        f"{num_versions_found} clang-format versions found "
-        f"for version {version}, but expected exactly 1 "
-        "(error code gcn7ebjkj3)"
-      )
+      ) from e
+    raise
 
+  return github_release_info_from_release_json(parse_json(release_json))
 
-@dataclasses.dataclass(frozen=True)
+
+@dataclasses.dataclass(slots=True)
 class LlvmReleaseArtifact:
   operating_system: str
   cpu_architecture: str
@@ -241,96 +503,235 @@ class LlvmReleaseArtifact:
 def get_llvm_github_artifact_for_current_platform(
   version: str, logger: logging.Logger
 ) -> LlvmReleaseArtifact:
+  # GitHub releases are immutable once published, so the resolved artifact for a given
+  # (version, os, arch) never changes and can be cached on disk indefinitely; on a cache hit
+  # the HTTP fetch and JSON parse of the release are skipped entirely.
+  operating_system, cpu_architecture = llvm_os_arch_for_current_platform()
+  cache_file = llvm_release_artifact_cache_file(version, operating_system, cpu_architecture)
+  cached_artifact = load_cached_llvm_release_artifact(
+    cache_file=cache_file,
+    operating_system=operating_system,
+    cpu_architecture=cpu_architecture,
+    logger=logger,
+  )
+  if cached_artifact is not None:
+    logger.debug("Using cached artifact info from %s", cache_file)
+    return cached_artifact
+
   release = get_llvm_github_release(version, logger)
   artifacts = llvm_release_artifacts_from_llvm_github_release_assets(
     llvm_version=release.version,
     assets=release.assets,
   )
-  return artifact_for_current_platform_from_llvm_release_artifacts(artifacts)
+  artifact = artifact_for_current_platform_from_llvm_release_artifacts(artifacts)
+  save_cached_llvm_release_artifact(cache_file, artifact, logger)
+  return artifact
+
+
+def llvm_release_artifact_cache_file(
+  version: str,
+  operating_system: str,
+  cpu_architecture: str,
+) -> pathlib.Path:
+  file_name = scrubbed_file_name(f"v{version}-{operating_system}-{cpu_architecture}.json")
+  return plugin_cache_dir() / "artifacts" / file_name
+
+
+def load_cached_llvm_release_artifact(
+  cache_file: pathlib.Path,
+  operating_system: str,
+  cpu_architecture: str,
+  logger: logging.Logger,
+) -> LlvmReleaseArtifact | None:
+  try:
+    cached_artifact = parse_json(cache_file.read_bytes())
+  except FileNotFoundError:
+    return None
+  except (OSError, ValueError) as e:
+    logger.warning("Reading artifact cache file %s failed: %s (ignoring error)", cache_file, e)
+    return None
+
+  try:
+    return LlvmReleaseArtifact(
+      operating_system=operating_system,
+      cpu_architecture=cpu_architecture,
+      asset=github_release_asset_from_json(cached_artifact["asset"]),
+      signature_asset=github_release_asset_from_json(cached_artifact["signature_asset"]),
+    )
+  except (KeyError, TypeError) as e:
+    logger.warning("Ignoring malformed artifact cache file %s: %s", cache_file, e)
+    return None
+
+
+def github_release_asset_from_json(asset: typing.Any) -> GitHubReleaseAsset:
+  return GitHubReleaseAsset(
+    name=asset["name"],
+    size=asset["size"],
+    download_url=asset["download_url"],
+  )
+
+
+def save_cached_llvm_release_artifact(
+  cache_file: pathlib.Path,
+  artifact: LlvmReleaseArtifact,
+  logger: logging.Logger,
+) -> None:
+  # A failure to write the cache merely degrades performance, not correctness,
+  # so log and otherwise ignore any errors that occur.
+  cached_artifact = {
+    "asset": dataclasses.asdict(artifact.asset),
+    "signature_asset": dataclasses.asdict(artifact.signature_asset),
+  }
+  try:
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_cache_file = cache_file.with_name(cache_file.name + ".tmp")
+    temp_cache_file.write_text(json.dumps(cached_artifact), encoding="utf8")
+    os.replace(temp_cache_file, cache_file)
+  except OSError as e:
+    logger.warning("Saving artifact cache file %s failed: %s (ignoring error)", cache_file, e)
+
+
+def clang_format_binary_manifest_file(
+  version: str,
+  operating_system: str,
+  cpu_architecture: str,
+) -> pathlib.Path:
+  file_name = scrubbed_file_name(f"v{version}-{operating_system}-{cpu_architecture}-binary.json")
+  return plugin_cache_dir() / "binaries" / file_name
+
+
+def load_cached_clang_format_binary_num_bytes(
+  manifest_file: pathlib.Path,
+  logger: logging.Logger,
+) -> int | None:
+  try:
+    manifest = parse_json(manifest_file.read_bytes())
+  except FileNotFoundError:
+    return None
+  except (OSError, ValueError) as e:
+    logger.warning("Reading binary manifest file %s failed: %s (ignoring error)", manifest_file, e)
+    return None
+
+  if not isinstance(manifest, dict):
+    return None
+  num_bytes = typing.cast(dict[str, typing.Any], manifest).get("num_bytes")
+  return num_bytes if isinstance(num_bytes, int) else None
+
+
+def save_cached_clang_format_binary_num_bytes(
+  manifest_file: pathlib.Path,
+  num_bytes: int,
+  logger: logging.Logger,
+) -> None:
+  # A failure to write the manifest merely degrades performance, not correctness,
+  # so log and otherwise ignore any errors that occur.
+  try:
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_manifest_file = manifest_file.with_name(manifest_file.name + ".tmp")
+    temp_manifest_file.write_text(json.dumps({"num_bytes": num_bytes}), encoding="utf8")
+    os.replace(temp_manifest_file, manifest_file)
+  except OSError as e:
+    logger.warning("Saving binary manifest file %s failed: %s (ignoring error)", manifest_file, e)
 
 
 def llvm_release_artifacts_from_llvm_github_release_assets(
   llvm_version: str,
   assets: Sequence[GitHubReleaseAsset],
-) -> list[LlvmReleaseArtifact]:
-  tarball_regex = re.compile(
-    re.escape(f"LLVM-{llvm_version}-") + r"(\w+)-(\w+)" + re.escape(".tar.xz")
-  )
-  signature_regex = re.compile(
-    re.escape(f"LLVM-{llvm_version}-") + r"(\w+)-(\w+)" + re.escape(".tar.xz.jsonl")
-  )
-
-  tarballs: dict[tuple[str, str], GitHubReleaseAsset] = {}
-  signatures: dict[tuple[str, str], GitHubReleaseAsset] = {}
+) -> dict[tuple[str, str], LlvmReleaseArtifact]:
+  """Return the release's artifacts, keyed by (operating_system, cpu_architecture)."""
+  # Asset names look like "LLVM-<version>-<os>-<arch>.tar.<extension>[.jsonl]"; plain string
+  # prefix/suffix tests classify them with far less work than regular expression matching,
+  # which adds up over hundreds of assets.
+  asset_name_prefix = f"LLVM-{llvm_version}-"
+
+  tarballs: dict[tuple[str, str, str], GitHubReleaseAsset] = {}
+  signatures: dict[tuple[str, str, str], GitHubReleaseAsset] = {}
   for asset in assets:
-    tarball_match = tarball_regex.fullmatch(asset.name)
-    signature_match = signature_regex.fullmatch(asset.name)
-    if tarball_match is not None and signature_match is None:
-      dest_dict = tarballs
-      match = tarball_match
-    elif tarball_match is None and signature_match is not None:
-      dest_dict = signatures
-      match = signature_match
-    elif tarball_match is None and signature_match is None:
+    if not asset.name.startswith(asset_name_prefix):
       continue
+    rest = asset.name[len(asset_name_prefix) :]
+
+    if rest.endswith(".jsonl"):
+      dest_dict = signatures
+      rest = rest[: -len(".jsonl")]
     else:
-      raise Exception(
-        "internal error e4bpy4jjmz: both tarball_match and signature_match are not None, "
-        "but at most one of them should be not None: "
-        f"tarball_match={tarball_match!r} signature_match={signature_match!r}"
-      )
+      dest_dict = tarballs
+
+    if rest.endswith(".tar.xz"):
+      extension = "xz"
+      os_arch = rest[: -len(".tar.xz")]
+    elif rest.endswith(".tar.zst"):
+      extension = "zst"
+      os_arch = rest[: -len(".tar.zst")]
+    else:
+      continue
 
-    os = match.group(1).lower()
-    arch = match.group(2).lower()
-    dest_dict[(os, arch)] = asset
+    os, separator, arch = os_arch.partition("-")
+    if not separator or not os or not arch or "-" in arch:
+      continue
+
+    dest_dict[(os.lower(), arch.lower(), extension)] = asset
 
-  artifacts: list[LlvmReleaseArtifact] = []
-  for key, tarball_asset in tarballs.items():
-    if (signature_asset := signatures.get(key)) is None:
-      # Ignore artifacts that lack a corresponding sigstore bundle,
-      # as without it the authenticity cannot be verified.
+  preferred_extensions = supported_tar_archive_extensions()
+  artifacts: dict[tuple[str, str], LlvmReleaseArtifact] = {}
+  seen_platforms: set[tuple[str, str]] = set()
+  for os, arch, _ in tarballs:
+    if (os, arch) in seen_platforms:
       continue
+    seen_platforms.add((os, arch))
+
+    for extension in preferred_extensions:
+      tarball_asset = tarballs.get((os, arch, extension))
+      signature_asset = signatures.get((os, arch, extension))
+      if tarball_asset is None or signature_asset is None:
+        # Ignore artifacts that lack a corresponding sigstore bundle,
+        # as without it the authenticity cannot be verified.
+        continue
 
-    artifacts.append(
-      LlvmReleaseArtifact(
-        operating_system=key[0],
-        cpu_architecture=key[1],
+      artifacts[(os, arch)] = LlvmReleaseArtifact(
+        operating_system=os,
+        cpu_architecture=arch,
         asset=tarball_asset,
         signature_asset=signature_asset,
       )
-    )
+      break
 
   return artifacts
 
 
+@functools.cache
+def supported_tar_archive_extensions() -> tuple[str, ...]:
+  """Return the supported tarball compression extensions, in order of preference.
+
+  Zstandard decompresses several times faster than xz, so ".tar.zst" release assets are
+  preferred over ".tar.xz" when a zstd executable is available to decompress them.
+  """
+  if shutil.which("zstd") is not None:
+    return ("zst", "xz")
+  return ("xz",)
+
+
 def artifact_for_current_platform_from_llvm_release_artifacts(
-  artifacts: Sequence[LlvmReleaseArtifact],
+  artifacts: Mapping[tuple[str, str], LlvmReleaseArtifact],
 ) -> LlvmReleaseArtifact:
   platform = llvm_os_arch_for_current_platform()
-  matching_artifacts = [
-    artifact
-    for artifact in artifacts
-    if (artifact.operating_system, artifact.cpu_architecture) == platform
-  ]
-
-  match len(matching_artifacts):
-    case 0:
-      raise ArtifactNotFoundError(
-        f"no artifact found for current platform: {platform} (error code akkf4cpkep)"
-      )
-    case 1:
-      return matching_artifacts[0]
-    case num_matching_artifacts:
-      raise MultipleArtifactsFoundError(
-        f"{num_matching_artifacts} artifacts found for current platform {platform}, "
-        "but expected exactly 1 (error code g5d36np3ps)"
-      )
+  artifact = artifacts.get(platform)
+  if artifact is None:
+    raise ArtifactNotFoundError(
+      f"no artifact found for current platform: {platform} (error code akkf4cpkep)"
+    )
+  return artifact
 
 
+# The platform never changes during the lifetime of the process, so compute it at most once;
+# UnsupportedPlatformError still raises lazily, on the first call.
+@functools.cache
 def llvm_os_arch_for_current_platform() -> tuple[str, str]:
-  uname_result = platform.uname()
+  # os.uname() is a single syscall, unlike platform.uname() which may probe further system
+  # details via subprocesses; only the system name and machine are needed here anyway.
+  uname_result = os.uname()
 
-  match (uname_result.system.lower(), uname_result.machine.lower()):
+  match (uname_result.sysname.lower(), uname_result.machine.lower()):
     case ("linux", "x86_64"):
       return ("linux", "x64")
     case ("darwin", "arm64"):
@@ -343,23 +744,19 @@ def llvm_os_arch_for_current_platform() -> tuple[str, str]:
 
 
 def untar_single_file(
-  tarxz_file: pathlib.Path,
+  tar_archive_file: pathlib.Path,
   dest_dir: pathlib.Path,
   file_name: str,
   estimated_num_entries: int,
   logger: logging.Logger,
 ) -> pathlib.Path:
-  logger.info("Extracting %s from %s to %s", file_name, tarxz_file, dest_dir)
+  import tqdm
 
-  logger.info("Searching for %s in %s", file_name, tarxz_file)
+  logger.info("Extracting %s from %s to %s", file_name, tar_archive_file, dest_dir)
 
-  # TODO: remove the typing cruft below once pyright recognizes the "r|xz" argument;
-  # at the time of writing, it doesn't recognize these "streaming" modes, but only
-  # the basic modes, like "r:xz".
-  tar_file = tarfile.open(  # pyright: ignore[reportUnknownVariableType,reportCallIssue]
-    tarxz_file,
-    "r|xz",  # pyright: ignore[reportArgumentType]
-  )
+  logger.info("Searching for %s in %s", file_name, tar_archive_file)
+
+  tar_file, decompress_process = open_streaming_tar_archive(tar_archive_file, logger)
 
   progress_bar_context_manager = tqdm.tqdm(
     desc=f"Extracting {file_name}",
@@ -367,69 +764,192 @@ def untar_single_file(
     leave=False,
     unit=" files",
     dynamic_ncols=True,
+    # Coalesce renders: one terminal redraw per 64 entries (and at most 4 per second) instead
+    # of one per entry, since the loop body is far cheaper than a terminal refresh.
+    miniters=64,
+    mininterval=0.25,
+    # Skip progress bar updates entirely when running non-interactively (e.g. invoked by asdf
+    # in a CI pipeline) since there is nobody watching and the updates are not free.
+    disable=not sys.stderr.isatty(),
   )
 
-  tar_file = typing.cast(tarfile.TarFile, tar_file)
   with tar_file, progress_bar_context_manager as progress_bar:
-    matching_tar_infos: list[tarfile.TarInfo] = []
+    extracted_file: pathlib.Path | None = None
     for tar_info in tar_file:
       progress_bar.update(1)
-      if not tar_info.isfile():
+      # Cheap string test first: nearly every entry fails the name check, so skip the
+      # PurePosixPath allocation and file-type check for the thousands of non-matches.
+      tar_info_name = tar_info.name
+      if tar_info_name != file_name and not tar_info_name.endswith("/" + file_name):
         continue
 
-      tar_info_path = pathlib.PurePosixPath(tar_info.name)
-      if tar_info_path.name != file_name:
+      if not tar_info.isfile():
         continue
 
-      progress_bar.clear()
-      logger.info("Found %s in %s: %s", file_name, tarxz_file, tar_info.name)
-      progress_bar.refresh()
-      matching_tar_infos.append(tar_info)
-      if len(matching_tar_infos) > 1:
-        continue  # The error will be reported later on.
+      # Validate the entry's path before using it to create any directories; otherwise an
+      # absolute or dot-dot path in a malicious archive would escape dest_dir via the
+      # mkdir() call below before extraction itself rejects it.
+      validate_tar_file_entry_path(tar_info.name)
 
       dest_file = dest_dir / tar_info.name
       progress_bar.clear()
-      logger.info("Extracting %s from %s to %s", tar_info.name, tarxz_file, dest_file)
+      logger.info("Extracting %s from %s to %s", tar_info.name, tar_archive_file, dest_file)
       progress_bar.refresh()
-      tar_file.extract(tar_info, dest_dir, filter="data")
+      # The entry's path within the archive is preserved beneath dest_dir, so the
+      # intermediate directories must be created for this one extracted file.
+      dest_file.parent.mkdir(parents=True, exist_ok=True)
+      extract_tar_file_entry(tar_file, tar_info, dest_file)
+      extracted_file = dest_file
+
+      # The file of interest occurs exactly once in LLVM release archives, and it appears
+      # early (under bin/), so stop streaming as soon as it has been extracted rather than
+      # decompressing the thousands of entries that follow it.
+      break
+
+  if extracted_file is None:
+    if decompress_process is not None:
+      decompress_returncode = decompress_process.wait()
+      if decompress_returncode != 0:
+        raise Exception(
+          f"xz decompression of {tar_archive_file} failed: "
+          f"xz completed with non-zero exit code {decompress_returncode} (error code e6ym6vk2pd)"
+        )
+    raise FileNotFoundInTarFileError(
+      f"no file named {file_name} found in tar file: {tar_archive_file} (error code j9ebr9gyhb)"
+    )
 
-  match len(matching_tar_infos):
-    case 0:
-      raise FileNotFoundInTarFileError(
-        f"no file named {file_name} found in tar file: {tarxz_file} (error code j9ebr9gyhb)"
+  if decompress_process is not None:
+    # The archive stream was deliberately abandoned mid-file, so the decompressor is expected
+    # to fail with a broken pipe; close its output to hasten that and reap it without
+    # checking the exit code.
+    if decompress_process.stdout is not None:
+      decompress_process.stdout.close()
+    decompress_process.wait()
+
+  return extracted_file
+
+
+# The number of bytes copied at a time when extracting a file entry from a tar archive;
+# tarfile's own extract() uses a 16 KiB buffer, incurring many more write() syscalls.
+EXTRACT_COPY_CHUNK_NUM_BYTES = 1024 * 1024
+
+
+def extract_tar_file_entry(
+  tar_file: tarfile.TarFile,
+  tar_info: tarfile.TarInfo,
+  dest_file: pathlib.Path,
+) -> None:
+  """Extract the given regular-file tar entry to the given destination file.
+
+  Performs the same path-traversal validation as tarfile's "data" extraction filter for the
+  entries this plugin extracts, but copies the file contents with a much larger buffer than
+  tarfile.extract() and preserves only the entry's permission bits.
+
+  The parent directory of dest_file must already exist.
+  """
+  validate_tar_file_entry_path(tar_info.name)
+
+  src_file = tar_file.extractfile(tar_info)
+  if src_file is None:
+    raise FileNotFoundInTarFileError(
+      f"tar file entry is not a regular file: {tar_info.name} (error code ebadkh49c8)"
+    )
+
+  with src_file, dest_file.open("wb") as output_file:
+    shutil.copyfileobj(src_file, output_file, length=EXTRACT_COPY_CHUNK_NUM_BYTES)
+
+  dest_file.chmod(tar_info.mode & 0o777)
+
+
+def validate_tar_file_entry_path(tar_info_name: str) -> None:
+  """Raise UnsafeTarFileEntryError if the given tar entry path could escape its dest dir.
+
+  Performs the same path-traversal validation as tarfile's "data" extraction filter for the
+  entries this plugin extracts. Must be called before the entry's path is used to create any
+  files or directories.
+  """
+  entry_path = pathlib.PurePosixPath(tar_info_name)
+  if entry_path.is_absolute() or ".." in entry_path.parts:
+    raise UnsafeTarFileEntryError(
+      f"refusing to extract unsafe path from tar file: {tar_info_name} (error code w73mtrr3xj)"
+    )
+
+
+def open_streaming_tar_archive(
+  tar_archive_file: pathlib.Path,
+  logger: logging.Logger,
+) -> tuple[tarfile.TarFile, subprocess.Popen[bytes] | None]:
+  """Open the given .tar.xz or .tar.zst file for streaming (i.e. non-seeking) reads.
+
+  For .tar.xz files, if the "xz" executable is found in the PATH then it is used to decompress
+  the file, since it supports multi-threaded decompression, using all CPU cores, whereas
+  Python's built-in lzma module is single-threaded. Otherwise, falls back to Python's built-in
+  (slower, but always available) decompression. For .tar.zst files the "zstd" executable is
+  used, whose presence in the PATH is a precondition for .tar.zst assets being selected at all.
+
+  Returns the opened tar file and the decompressing child process, if one was started. The
+  caller is responsible for calling wait() on the returned child process after closing the
+  tar file.
+  """
+  import tarfile
+
+  if tar_archive_file.name.endswith(".tar.zst"):
+    zstd_executable = shutil.which("zstd")
+    if zstd_executable is None:
+      raise Exception(
+        "zstd executable not found in the PATH, but it is required to decompress "
+        f"{tar_archive_file} (error code sha7te55bs)"
       )
-    case 1:
-      # It is safe to ignore the pyright typing error below as this code path can _only_ be
-      # reached if `dest_file` has been bound.
-      return dest_file  # pyright: ignore[reportPossiblyUnboundVariable]
-    case num_files_found:
-      raise MultipleFilesFoundInTarFileError(
-        f"{num_files_found} files named {file_name} found in tar file {tarxz_file}, "
-        "but expected exactly 1 (error code cstaaxdsn9)"
+    decompress_args = [zstd_executable, "-dc", str(tar_archive_file)]
+  else:
+    xz_executable = shutil.which("xz")
+    if xz_executable is None:
+      logger.info("xz executable not found in the PATH; decompressing with Python's lzma module")
+      # TODO: remove the typing cruft below once pyright recognizes the "r|xz" argument;
+      # at the time of writing, it doesn't recognize these "streaming" modes, but only
+      # the basic modes, like "r:xz".
+      tar_file = tarfile.open(  # pyright: ignore[reportUnknownVariableType,reportCallIssue]
+        tar_archive_file,
+        "r|xz",  # pyright: ignore[reportArgumentType]
       )
+      return (typing.cast(tarfile.TarFile, tar_file), None)
+    decompress_args = [xz_executable, "-dc", "-T0", str(tar_archive_file)]
+
+  logger.info("Running command: %s", subprocess.list2cmdline(decompress_args))
+  decompress_process = subprocess.Popen(
+    decompress_args,
+    stdout=subprocess.PIPE,
+    bufsize=1024 * 1024,
+  )
+  tar_file = tarfile.open(
+    fileobj=decompress_process.stdout,
+    mode="r|",
+  )
+  return (tar_file, decompress_process)
 
 
 class ArtifactNotFoundError(Exception):
   pass
 
 
-class MultipleArtifactsFoundError(Exception):
+class FileNotFoundInTarFileError(Exception):
   pass
 
 
-class FileNotFoundInTarFileError(Exception):
+class UnsafeTarFileEntryError(Exception):
   pass
 
 
-class MultipleFilesFoundInTarFileError(Exception):
-  pass
+# Memoizes the sigstore Verifier (and with it the fetched TUF trust root) so that repeated
+# verifications in one process pay for the trust-root refresh only once.
+_cached_sigstore_verifier: typing.Any = None
 
 
 def verify_sigstore_signature(
   file_to_verify: pathlib.Path,
   bundle_file: pathlib.Path,
   logger: logging.Logger,
+  sha256_digest: bytes | None = None,
 ) -> None:
   logger.info(
     "Verifying signature of file %s using sigstore bundle from file %s",
@@ -437,6 +957,67 @@ def verify_sigstore_signature(
     bundle_file,
   )
 
+  try:
+    from sigstore.errors import VerificationError
+
+    # HashAlgorithm is re-exported by sigstore.hashes on sigstore 3.x but not on 4.x, where
+    # pyright wants it imported from sigstore_models.common.v1 instead; importing it here
+    # works at runtime on both major versions.
+    from sigstore.hashes import Hashed, HashAlgorithm  # pyright: ignore[reportPrivateImportUsage]
+    from sigstore.models import Bundle
+    from sigstore.verify import Verifier, policy
+  except ImportError:
+    # The sigstore library is not importable in this interpreter (e.g. installed for a
+    # different Python version), so fall back to running it as a subprocess.
+    verify_sigstore_signature_with_subprocess(file_to_verify, bundle_file, logger)
+    return
+
+  if sha256_digest is None:
+    # hashlib.file_digest() hashes with a fixed reusable buffer entirely in C, keeping
+    # memory bounded rather than materializing the whole file.
+    with file_to_verify.open("rb") as input_file:
+      sha256_digest = hashlib.file_digest(input_file, "sha256").digest()
+
+  # Calling the sigstore API in-process avoids the interpreter cold-start and the
+  # (substantial) sigstore import graph load that spawning `python -m sigstore` incurs.
+  # Handing it the precomputed digest (already calculated in-flight during the download)
+  # also avoids re-reading the entire tar archive from disk.
+  # Building a production Verifier refreshes the Sigstore TUF trust root, a multi-round-trip
+  # fetch; reuse one instance for all verifications in this process. (Typed as Any since the
+  # sigstore library may not be importable at module load.)
+  global _cached_sigstore_verifier
+  if _cached_sigstore_verifier is None:
+    _cached_sigstore_verifier = Verifier.production()
+  verifier = _cached_sigstore_verifier
+
+  # The bundle is network-supplied data; parse it inside the guarded block so a malformed or
+  # truncated bundle surfaces as a SignatureVerificationError rather than a raw parser
+  # traceback. Its parse errors do not share a useful base class with VerificationError
+  # across sigstore versions, so catch Exception.
+  try:
+    bundle = Bundle.from_json(bundle_file.read_bytes())
+  except Exception as e:
+    raise SignatureVerificationError(
+      f"Parsing sigstore bundle {bundle_file} failed: {e} (error code ts8c53kq6n)"
+    ) from e
+
+  try:
+    verifier.verify_artifact(
+      input_=Hashed(algorithm=HashAlgorithm.SHA2_256, digest=sha256_digest),
+      bundle=bundle,
+      policy=policy.GitHubWorkflowRepository("llvm/llvm-project"),
+    )
+  except VerificationError as e:
+    raise SignatureVerificationError(
+      f"Verifying sigstore signature of {file_to_verify} failed: {e} (error code fmcv2rk9xa)"
+    ) from e
+
+
+def verify_sigstore_signature_with_subprocess(
+  file_to_verify: pathlib.Path,
+  bundle_file: pathlib.Path,
+  logger: logging.Logger,
+) -> None:
   sigstore_args: list[str] = [
     sys.executable,
     "-m",
@@ -487,11 +1068,27 @@ def verify_sigstore_signature(
     )
 
 
+# The number of bytes downloaded and written to disk at a time by download_github_release_asset().
+DOWNLOAD_CHUNK_NUM_BYTES = 1024 * 1024
+
+# The number of reusable download buffers, and therefore the maximum number of chunks that can
+# be in flight between the network reader and the disk writer at any moment.
+DOWNLOAD_NUM_BUFFERS = 4
+
+
+@dataclasses.dataclass(frozen=True)
+class DownloadedGitHubReleaseAsset:
+  url: str
+  sha256_digest: bytes
+
+
 def download_github_release_asset(
   asset: GitHubReleaseAsset,
   dest_file: pathlib.Path,
   logger: logging.Logger,
-) -> str:
+) -> DownloadedGitHubReleaseAsset:
+  import tqdm
+
   download_url = asset.download_url
   download_num_bytes = asset.size
 
@@ -504,7 +1101,35 @@ def download_github_release_asset(
   if download_num_bytes < 0:
     raise Exception(f"invalid download_num_bytes: {download_num_bytes:,} (error code px5e9pqbaz)")
 
-  dest_file.parent.mkdir(parents=True, exist_ok=True)
+  # If a previous attempt left a partial file behind then ask the server for only the
+  # missing byte range rather than re-transferring the bytes already on disk.
+  resume_offset = 0
+  if dest_file.is_file():
+    existing_num_bytes = dest_file.stat().st_size
+    if 0 < existing_num_bytes < download_num_bytes:
+      resume_offset = existing_num_bytes
+
+  # A single TCP stream often cannot saturate the available bandwidth to the GitHub CDN, so
+  # fetch large assets as several concurrent ranged requests; small assets and resumed
+  # downloads stay on the simpler single-stream path.
+  if resume_offset == 0 and download_num_bytes >= MULTIPART_DOWNLOAD_MIN_NUM_BYTES:
+    multipart_download = download_github_release_asset_multipart(asset, dest_file, logger)
+    if multipart_download is not None:
+      return multipart_download
+    logger.info(
+      "Server did not honor ranged requests for %s; downloading as a single stream",
+      download_url,
+    )
+
+  request_headers: dict[str, str] = {}
+  if resume_offset > 0:
+    request_headers["Range"] = f"bytes={resume_offset}-"
+    logger.info(
+      "Resuming download of %s at byte %s of %s",
+      download_url,
+      f"{resume_offset:,}",
+      f"{download_num_bytes:,}",
+    )
 
   progress_bar_context_manager = tqdm.tqdm(
     desc="Downloading",
@@ -513,32 +1138,256 @@ def download_github_release_asset(
     unit=" bytes",
     unit_scale=True,
     dynamic_ncols=True,
+    # Updates arrive once per 1 MiB chunk; cap terminal redraws at 4 per second.
+    mininterval=0.25,
+    # Skip progress bar updates entirely when running non-interactively (e.g. invoked by asdf
+    # in a CI pipeline) since there is nobody watching and the updates are not free.
+    disable=not sys.stderr.isatty(),
   )
   with progress_bar_context_manager as progress_bar:
-    with requests.get(download_url, stream=True) as response:
+    with http_session().get(download_url, stream=True, headers=request_headers) as response:
       response.raise_for_status()
-      downloaded_num_bytes = 0
-      with dest_file.open("wb") as output_file:
-        for chunk in response.iter_content(chunk_size=65536):
-          downloaded_num_bytes += len(chunk)
-          if downloaded_num_bytes > download_num_bytes:
-            raise TooManyBytesDownloadedError(
-              f"Downloaded {downloaded_num_bytes:,} bytes from {download_url}, "
-              f"which is {downloaded_num_bytes - download_num_bytes:,} bytes more "
-              f"than expected ({download_num_bytes:,}) (error code cv7fp9jb2e)"
-            )
+      if resume_offset > 0 and response.status_code != 206:
+        # The server ignored the Range request and is sending the entire file.
+        resume_offset = 0
+
+      # Read straight from the underlying urllib3 response rather than via iter_content(),
+      # skipping requests' chunk generator; GitHub release assets are not content-encoded,
+      # so there is nothing for requests to decode anyway. The large chunk size amortizes
+      # the per-chunk interpreter overhead over many more bytes.
+      response.raw.decode_content = False
+
+      # Hash the bytes as they stream in so that signature verification later on does not
+      # need to re-read the (potentially huge) file from disk. When resuming, the bytes
+      # already on disk must be fed to the hasher first.
+      hasher = hashlib.sha256()
+      if resume_offset > 0:
+        with dest_file.open("rb") as existing_file:
+          while existing_chunk := existing_file.read(DOWNLOAD_CHUNK_NUM_BYTES):
+            hasher.update(existing_chunk)
+        progress_bar.update(resume_offset)
+
+      downloaded_num_bytes = resume_offset
+      written_num_bytes = resume_offset
+      writer_error: Exception | None = None
+
+      # Recycle a small pool of fixed-size buffers between the reader and the writer so the
+      # whole transfer reuses the same few allocations, instead of allocating (and discarding)
+      # one bytes object per chunk. A buffer returns to the free pool only once the writer is
+      # finished with it, which also bounds how far the reader can run ahead of the disk.
+      free_buffers: queue.Queue[bytearray] = queue.Queue()
+      for _ in range(DOWNLOAD_NUM_BUFFERS):
+        free_buffers.put(bytearray(DOWNLOAD_CHUNK_NUM_BYTES))
+      chunk_queue: queue.Queue[tuple[bytearray, int] | None] = queue.Queue()
+
+      with dest_file.open("ab" if resume_offset > 0 else "wb") as output_file:
+        if resume_offset == 0 and download_num_bytes > 0:
+          # Tell the filesystem the final file size up front so that it can allocate
+          # contiguous extents, rather than growing the file one chunk at a time.
+          # posix_fallocate reserves the blocks for real (a truncate merely produces a
+          # sparse file); it is unavailable on macOS, where the truncate hint suffices.
+          if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(output_file.fileno(), 0, download_num_bytes)
+          else:
+            output_file.truncate(download_num_bytes)
+
+        # Write (and hash) chunks on a separate thread so that waiting for the network and
+        # waiting for the disk overlap, instead of strictly alternating on one thread.
+        def write_queued_chunks() -> None:
+          nonlocal written_num_bytes, writer_error
+          while (queued_chunk := chunk_queue.get()) is not None:
+            buffer, chunk_num_bytes = queued_chunk
+            if writer_error is None:
+              try:
+                with memoryview(buffer)[:chunk_num_bytes] as chunk:
+                  output_file.write(chunk)
+                  written_num_bytes += chunk_num_bytes
+                  hasher.update(chunk)
+                progress_bar.update(chunk_num_bytes)
+              except Exception as e:
+                # The error is re-raised on the main thread after the download loop ends;
+                # keep consuming chunks so that the loop never blocks forever on an
+                # exhausted buffer pool.
+                writer_error = e
+            free_buffers.put(buffer)
+
+        writer_thread = threading.Thread(target=write_queued_chunks, name="download_writer")
+        writer_thread.start()
+        try:
+          while True:
+            buffer = free_buffers.get()
+            chunk_num_bytes = response.raw.readinto(buffer)
+            if not chunk_num_bytes:
+              break
+            downloaded_num_bytes += chunk_num_bytes
+            if downloaded_num_bytes > download_num_bytes:
+              raise TooManyBytesDownloadedError(
+                f"Downloaded {downloaded_num_bytes:,} bytes from {download_url}, "
+                f"which is {downloaded_num_bytes - download_num_bytes:,} bytes more "
+                f"than expected ({download_num_bytes:,}) (error code cv7fp9jb2e)"
+              )
+
+            chunk_queue.put((buffer, chunk_num_bytes))
+        finally:
+          chunk_queue.put(None)
+          writer_thread.join()
+
+        if writer_error is not None:
+          output_file.truncate(written_num_bytes)
+          raise writer_error
+
+        if downloaded_num_bytes != download_num_bytes:
+          # Trim the preallocated tail so that a later attempt can resume from the bytes
+          # that were actually downloaded.
+          output_file.truncate(written_num_bytes)
+          raise TooFewBytesDownloadedError(
+            f"Downloaded {downloaded_num_bytes:,} bytes from {download_url}, "
+            f"which is {download_num_bytes - downloaded_num_bytes:,} bytes fewer "
+            f"than expected ({download_num_bytes:,}) (error code rf4n374kdm)"
+          )
 
-          output_file.write(chunk)
-          progress_bar.update(len(chunk))
+  return DownloadedGitHubReleaseAsset(url=download_url, sha256_digest=hasher.digest())
 
-      if downloaded_num_bytes != download_num_bytes:
-        raise TooFewBytesDownloadedError(
-          f"Downloaded {downloaded_num_bytes:,} bytes from {download_url}, "
-          f"which is {download_num_bytes - downloaded_num_bytes:,} bytes fewer "
-          f"than expected ({download_num_bytes:,}) (error code rf4n374kdm)"
-        )
 
-  return download_url
+def download_github_release_asset_multipart(
+  asset: GitHubReleaseAsset,
+  dest_file: pathlib.Path,
+  logger: logging.Logger,
+) -> DownloadedGitHubReleaseAsset | None:
+  """Download the given asset as several concurrent HTTP range requests.
+
+  Each worker writes its byte range into the preallocated destination file with os.pwrite(),
+  so no post-download reassembly is needed. Returns None, leaving the destination file empty,
+  if the server does not honor range requests (every worker then receives a plain 200 and
+  writes nothing); the caller is expected to fall back to a single-stream download.
+  """
+  import tqdm
+
+  download_url = asset.download_url
+  download_num_bytes = asset.size
+
+  part_num_bytes = -(-download_num_bytes // MULTIPART_DOWNLOAD_NUM_PARTS)
+  part_ranges = [
+    (first_byte_index, min(first_byte_index + part_num_bytes, download_num_bytes) - 1)
+    for first_byte_index in range(0, download_num_bytes, part_num_bytes)
+  ]
+  logger.info(
+    "Downloading %s in %d concurrent parts of up to %s bytes each",
+    download_url,
+    len(part_ranges),
+    f"{part_num_bytes:,}",
+  )
+
+  progress_bar_context_manager = tqdm.tqdm(
+    desc="Downloading",
+    total=download_num_bytes,
+    leave=False,
+    unit=" bytes",
+    unit_scale=True,
+    dynamic_ncols=True,
+    # Updates arrive once per 1 MiB chunk; cap terminal redraws at 4 per second.
+    mininterval=0.25,
+    # Skip progress bar updates entirely when running non-interactively (e.g. invoked by asdf
+    # in a CI pipeline) since there is nobody watching and the updates are not free.
+    disable=not sys.stderr.isatty(),
+  )
+
+  output_fd = os.open(dest_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+  try:
+    with progress_bar_context_manager as progress_bar:
+      if hasattr(os, "posix_fallocate"):
+        os.posix_fallocate(output_fd, 0, download_num_bytes)
+      else:
+        os.ftruncate(output_fd, download_num_bytes)
+
+      def download_part(first_byte_index: int, last_byte_index: int) -> bool:
+        request_headers = {"Range": f"bytes={first_byte_index}-{last_byte_index}"}
+        with http_session().get(download_url, stream=True, headers=request_headers) as response:
+          response.raise_for_status()
+          if response.status_code != 206:
+            return False
+          response.raw.decode_content = False
+
+          # The total after the "/" in Content-Range (e.g. "bytes 0-99/1234") is the server's
+          # idea of the complete file size; if it disagrees with the asset size the ranges
+          # were computed from, the assembled file would be silently truncated or oversized
+          # and only fail much later, at signature verification.
+          content_range = response.headers.get("Content-Range", "")
+          total_str = content_range.rpartition("/")[2]
+          if total_str.isdigit() and int(total_str) != download_num_bytes:
+            if int(total_str) > download_num_bytes:
+              raise TooManyBytesDownloadedError(
+                f"Server reported a total size of {int(total_str):,} bytes for {download_url}, "
+                f"but {download_num_bytes:,} bytes were expected (error code gwvkabj6e3)"
+              )
+            raise TooFewBytesDownloadedError(
+              f"Server reported a total size of {int(total_str):,} bytes for {download_url}, "
+              f"but {download_num_bytes:,} bytes were expected (error code sk23h8n6fd)"
+            )
+
+          buffer = bytearray(DOWNLOAD_CHUNK_NUM_BYTES)
+          write_offset = first_byte_index
+          while chunk_num_bytes := response.raw.readinto(buffer):
+            if write_offset + chunk_num_bytes - 1 > last_byte_index:
+              raise TooManyBytesDownloadedError(
+                f"Downloaded more than the {last_byte_index - first_byte_index + 1:,} bytes "
+                f"requested for range {first_byte_index}-{last_byte_index} of {download_url} "
+                "(error code dwkkd44hmn)"
+              )
+            # os.pwrite() may write fewer bytes than asked; keep writing until the whole
+            # chunk has landed at its offset.
+            with memoryview(buffer)[:chunk_num_bytes] as chunk:
+              num_bytes_written = 0
+              while num_bytes_written < chunk_num_bytes:
+                num_bytes_written += os.pwrite(
+                  output_fd, chunk[num_bytes_written:], write_offset + num_bytes_written
+                )
+            write_offset += chunk_num_bytes
+            progress_bar.update(chunk_num_bytes)
+
+          if write_offset != last_byte_index + 1:
+            raise TooFewBytesDownloadedError(
+              f"Downloaded {write_offset - first_byte_index:,} bytes of the "
+              f"{last_byte_index - first_byte_index + 1:,} bytes requested for range "
+              f"{first_byte_index}-{last_byte_index} of {download_url} "
+              "(error code wjc29vkmps)"
+            )
+          return True
+
+      try:
+        with concurrent.futures.ThreadPoolExecutor(
+          max_workers=len(part_ranges)
+        ) as download_executor:
+          part_futures = [
+            download_executor.submit(download_part, first_byte_index, last_byte_index)
+            for first_byte_index, last_byte_index in part_ranges
+          ]
+          range_honored = [part_future.result() for part_future in part_futures]
+      except BaseException:
+        # The file's ranges may have been partially written in any order, so it is not a
+        # valid base for a byte-offset resume; empty it so a later attempt starts fresh.
+        os.ftruncate(output_fd, 0)
+        raise
+
+      if not all(range_honored):
+        os.ftruncate(output_fd, 0)
+        return None
+  finally:
+    os.close(output_fd)
+
+  # The parts complete in arbitrary order, so the digest cannot be computed in-flight as the
+  # single-stream path does; hash the assembled file instead, served from the page cache.
+  with dest_file.open("rb") as input_file:
+    sha256_digest = hashlib.file_digest(input_file, "sha256").digest()
+  return DownloadedGitHubReleaseAsset(url=download_url, sha256_digest=sha256_digest)
+
+
+# Assets at least this large are downloaded as several concurrent range requests; below this
+# size the extra connections cost more than the parallelism recovers.
+MULTIPART_DOWNLOAD_MIN_NUM_BYTES = 32 * 1024 * 1024
+
+# The number of concurrent range requests used for a multipart download.
+MULTIPART_DOWNLOAD_NUM_PARTS = 4
 
 
 class TooManyBytesDownloadedError(Exception):
@@ -565,10 +1414,6 @@ class ClangFormatVersionNotFoundError(Exception):
   pass
 
 
-class MultipleClangFormatVersionsFoundError(Exception):
-  pass
-
-
 class UnsupportedPlatformError(Exception):
   pass
 